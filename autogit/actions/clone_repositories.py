@@ -1,5 +1,7 @@
+import asyncio
 import os.path
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Optional
 from urllib.parse import urlparse
 
 import git
@@ -8,22 +10,34 @@ from git.exc import GitCommandError
 
 from autogit.data_types import RepoState
 from autogit.constants import CloningStates
-from autogit.utils.throttled_tasks_executor import ThrottledTasksExecutor
-from autogit.utils.helpers import get_access_token, get_default_branch
+from autogit.utils.helpers import get_access_token_for_domain, get_default_branch
 
 
+@lru_cache(maxsize=None)
 def get_repo_access_url(url: str) -> Optional[str]:
     """Converts repository url to url which is suitable for cloning"""
 
-    if access_token := get_access_token(url):
-        parsed_url = urlparse(url)
-        domain_with_access_token = f"api:{access_token}@{parsed_url.netloc.split('@')[-1]}"
-        parsed_url = parsed_url._replace(netloc=domain_with_access_token, scheme="https")
+    if url.startswith("https://"):  # Most common case does not need full url parsing
+        netloc, separator, path = url[len("https://") :].partition("/")
+        domain = netloc.rpartition("@")[2]
+        if access_token := get_access_token_for_domain(domain.lower()):
+            return f"https://api:{access_token}@{domain}{separator}{path}"
+        return None
+
+    parsed_url = urlparse(url)
+    domain = parsed_url.netloc.rpartition("@")[2]
+    if access_token := get_access_token_for_domain(domain.lower()):
+        parsed_url = parsed_url._replace(netloc=f"api:{access_token}@{domain}", scheme="https")
         return parsed_url.geturl()
     return None
 
 
 async def clone_repository(repo: RepoState) -> None:
+    """Clones repository with default (or source) branch without blocking the event loop."""
+    await asyncio.to_thread(clone_repository_in_current_thread, repo)
+
+
+def clone_repository_in_current_thread(repo: RepoState) -> None:
     """Clones repository with default (or source) branch."""
 
     clone_to = repo.args.clone_to
@@ -77,10 +91,3 @@ def print_cloned_repositories(repos):
                 repo_url = (repo.url + " " + CloningStates.CLONED.value).ljust(73, " ")
                 print(f"\033[1;34m|\033[0m - {repo_url} \033[1;34m|\033[0m")
     print("\033[1;34m|" + "".center(77, "-") + "|\033[0m")
-
-
-def clone_repositories(repos: Dict[str, RepoState], executor: ThrottledTasksExecutor) -> None:
-    for repo in repos.values():
-        executor.run(clone_repository(repo))
-    executor.wait_for_tasks_to_finish()
-    print_cloned_repositories(repos)
@@ -1,12 +1,17 @@
+import asyncio
 from typing import Dict
 import git
 from autogit.constants import ModificationState
 
 from autogit.data_types import RepoState
-from autogit.utils.throttled_tasks_executor import ThrottledTasksExecutor
 
 
 async def commit_and_push_changes(repo: RepoState) -> None:
+    """Commits and pushes all the changes without blocking the event loop."""
+    await asyncio.to_thread(commit_and_push_changes_in_current_thread, repo)
+
+
+def commit_and_push_changes_in_current_thread(repo: RepoState) -> None:
     g = git.Repo(repo.directory)
 
     if g.index.diff(None) or g.untracked_files:
@@ -51,10 +56,3 @@ def print_modified_repositories(repos: Dict[str, RepoState]):
                 print(repo.stderr)
 
     print("\033[1;34m|" + "".center(77, "-") + "|\033[0m")
-
-
-def commit_and_push_changes_for_each_repo(repos: Dict[str, RepoState], executor: ThrottledTasksExecutor) -> None:
-    for repo in repos.values():
-        executor.run(commit_and_push_changes(repo))
-    executor.wait_for_tasks_to_finish()
-    print_modified_repositories(repos)
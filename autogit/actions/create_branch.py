@@ -1,9 +1,7 @@
-from typing import Dict
-from git.cmd import Git
+from git.exc import GitCommandError
 
 from autogit.data_types import RepoState
-from autogit.utils.helpers import to_kebab_case
-from autogit.utils.throttled_tasks_executor import ThrottledTasksExecutor
+from autogit.utils.helpers import run_git_command, to_kebab_case
 
 
 async def create_branch(repo: RepoState):
@@ -13,12 +11,9 @@ async def create_branch(repo: RepoState):
         new_branch_name = f"{to_kebab_case(repo.args.commit_message)}-{repo.args.action_id}"
     repo.branch = new_branch_name
 
-    g = Git(repo.directory)
-    g.execute(["git", "checkout", "-b", repo.branch])
-    g.execute(["git", "pull", "origin", repo.branch])
+    status, _, stderr = await run_git_command(repo.directory, "checkout", "-b", repo.branch)
+    if status:
+        raise GitCommandError(["git", "checkout", "-b", repo.branch], status, stderr)
 
-
-def create_branch_for_each_repo(repos: Dict[str, RepoState], executor: ThrottledTasksExecutor) -> None:
-    for repo in repos.values():
-        executor.run_not_throttled(create_branch(repo))
-    executor.wait_for_tasks_to_finish()
+    # Result is ignored, because the remote branch usually does not exist yet
+    await run_git_command(repo.directory, "pull", "origin", repo.branch)
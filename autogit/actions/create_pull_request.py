@@ -1,13 +1,11 @@
 import json
 from logging import getLogger
-from typing import Dict
 
 import httpx
 from autogit.constants import PullRequestStates
 
 from autogit.data_types import RepoState, HttpRequestParams
 from autogit.utils.helpers import get_access_token
-from autogit.utils.throttled_tasks_executor import ThrottledTasksExecutor
 
 logger = getLogger()
 
@@ -86,10 +84,3 @@ async def create_pull_request(repo: RepoState):
             repo.pull_request_state = PullRequestStates.GOT_BAD_RESPONSE.value
             repo.pull_request_status_code = response.status_code
             repo.pull_request_reason = json.dumps(response.json())
-
-
-def create_pull_request_for_each_repo(repos: Dict[str, RepoState], executor: ThrottledTasksExecutor) -> None:
-    for repo in repos.values():
-        executor.run(create_pull_request(repo))
-    executor.wait_for_tasks_to_finish()
-    print_pull_requests(repos)
@@ -2,7 +2,7 @@ import logging
 
 import os
 import os.path
-from typing import Dict, List
+from typing import Dict, Iterable, List
 
 from autogit.data_types import CliArguments, RepoState
 from autogit.utils.helpers import (
@@ -16,40 +16,35 @@ logger = logging.getLogger()
 
 
 def is_url_or_git(file_names_or_repo_url: str) -> bool:
-    # TODO: use urlparse to verify if its url and use regexp for git url
-    return ".com" in file_names_or_repo_url.lower()
+    """Checks if provided value is a repository url, rather than a path to a file."""
+    return file_names_or_repo_url.startswith(("http://", "https://", "git@", "ssh://"))
 
 
 def read_repositories_from_file(repos_filename) -> List[str]:
-    """Reads a list of repositories from a file while ignoring commented out lines."""
+    """Reads a list of repositories from a file while ignoring empty and commented out lines."""
     with open(repos_filename) as f:
-        return [line.strip() for line in f.readlines() if not line.strip().startswith("#")]
+        return [line for line in (line.strip() for line in f) if line and not line.startswith("#")]
 
 
 def get_repository_states(args: CliArguments) -> Dict[str, RepoState]:
-    repo_urls = []
-    for file_names_or_repo_url in args.repos:
-        if not is_url_or_git(file_names_or_repo_url) and os.path.exists(file_names_or_repo_url):
-            newly_read_repos = read_repositories_from_file(file_names_or_repo_url)
-            repo_urls.extend(newly_read_repos)
-        else:
-            repo_urls.append(file_names_or_repo_url)
-
     branch = args.branch or to_kebab_case(args.commit_message)
 
     repos: Dict[str, RepoState] = {}
-    for repo_url in repo_urls:
-        repo_name = get_repo_name(repo_url)
-        repo_owner = get_repo_owner(repo_url)
-        domain = get_domain(repo_url)
-
-        repos[repo_name] = RepoState(
-            args=args,
-            name=repo_name,
-            owner=repo_owner,
-            url=repo_url,
-            domain=domain,
-            branch=branch,
-        )
+    for file_names_or_repo_url in args.repos:
+        if not is_url_or_git(file_names_or_repo_url) and os.path.exists(file_names_or_repo_url):
+            repo_urls: Iterable[str] = read_repositories_from_file(file_names_or_repo_url)
+        else:
+            repo_urls = (file_names_or_repo_url,)
+
+        for repo_url in repo_urls:
+            repo_name = get_repo_name(repo_url)
+            repos[repo_name] = RepoState(
+                args=args,
+                name=repo_name,
+                owner=get_repo_owner(repo_url),
+                url=repo_url,
+                domain=get_domain(repo_url),
+                branch=branch,
+            )
 
     return repos
@@ -1,9 +1,7 @@
+import asyncio
 import os
-import subprocess
-from typing import Dict
 
 from autogit.data_types import RepoState
-from autogit.utils.throttled_tasks_executor import ThrottledTasksExecutor
 from autogit.data_types import ModificationState
 
 
@@ -15,21 +13,15 @@ async def run_command(repo: RepoState) -> None:
         commands[0] = os.path.abspath(commands[0])
 
     # Execute commands
-    proc = subprocess.Popen(
-        repo.args.commands,
+    proc = await asyncio.create_subprocess_exec(
+        *repo.args.commands,
         cwd=os.path.abspath(repo.directory),
-        stdin=subprocess.PIPE,
-        stdout=subprocess.PIPE,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
     )
     # TODO: Show output in real time:  https://stackoverflow.com/a/20576150
-    repo.stdout, repo.stderr = proc.communicate()
+    repo.stdout, repo.stderr = await proc.communicate()  # type: ignore
     if proc.returncode:
         repo.modification_state = ModificationState.GOT_EXCEPTION.value
     else:
         repo.modification_state = ModificationState.MODIFIED.value
-
-
-def run_command_for_each_repo(repos: Dict[str, RepoState], executor: ThrottledTasksExecutor) -> None:
-    for repo in repos.values():
-        executor.run_not_throttled(run_command(repo))
-    executor.wait_for_tasks_to_finish()
@@ -1,26 +1,47 @@
 from typing import List, Optional
 from autogit.actions.argument_parsing import parse_command_line_arguments
 from autogit.actions.get_repository_states import get_repository_states
-from autogit.actions.clone_repositories import clone_repositories
-from autogit.actions.create_branch import create_branch_for_each_repo
-from autogit.actions.run_command import run_command_for_each_repo
+from autogit.actions.clone_repositories import clone_repository, print_cloned_repositories
+from autogit.actions.create_branch import create_branch
+from autogit.actions.run_command import run_command
 from autogit.actions.commit_and_push_changes import (
-    commit_and_push_changes_for_each_repo,
+    commit_and_push_changes,
+    print_modified_repositories,
 )
-from autogit.actions.create_pull_request import create_pull_request_for_each_repo
+from autogit.actions.create_pull_request import create_pull_request, print_pull_requests
+from autogit.constants import CloningStates
+from autogit.data_types import RepoState
 from autogit.utils.throttled_tasks_executor import ThrottledTasksExecutor
 
 
+async def process_repository(repo: RepoState, executor: ThrottledTasksExecutor) -> None:
+    """Executes all the actions for a single repository one after another.
+
+    Actions which call remote Git hosting services are throttled by the executor.
+    """
+    await executor.throttle()
+    await clone_repository(repo)
+    if repo.cloning_state != CloningStates.CLONED.value:
+        return
+    await create_branch(repo)
+    await run_command(repo)
+    await executor.throttle()
+    await commit_and_push_changes(repo)
+    await executor.throttle()
+    await create_pull_request(repo)
+
+
 def main(args: Optional[List[str]] = None) -> None:
     cli_args = parse_command_line_arguments(args)
     repos = get_repository_states(cli_args)
 
     with ThrottledTasksExecutor(delay_between_tasks=0.1) as executor:
-        clone_repositories(repos, executor)
-        create_branch_for_each_repo(repos, executor)
-        run_command_for_each_repo(repos, executor)
-        commit_and_push_changes_for_each_repo(repos, executor)
-        create_pull_request_for_each_repo(repos, executor)
+        for repo in repos.values():
+            executor.run_not_throttled(process_repository(repo, executor))
+
+    print_cloned_repositories(repos)
+    print_modified_repositories(repos)
+    print_pull_requests(repos)
 
 
 if __name__ == "__main__":
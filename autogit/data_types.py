@@ -4,7 +4,7 @@ from typing import Dict, List, Optional
 from autogit.constants import CloningStates, PullRequestStates, ModificationState
 
 
-@dataclass
+@dataclass(slots=True)
 class CliArguments:
     action_id: str  # Generated hash for action identification
     repos: List[str]  # A list of Urls or files containing Urls
@@ -15,7 +15,7 @@ class CliArguments:
     branch: Optional[str]  # Branch name for newly created changes
 
 
-@dataclass
+@dataclass(slots=True)
 class RepoState:
     args: CliArguments  # Parsed command line arguments
 
@@ -40,7 +40,7 @@ class RepoState:
     stderr: bytes = b""  # Standard error output from command execution
 
 
-@dataclass
+@dataclass(slots=True)
 class HttpRequestParams:
     url: str
     headers: Dict[str, str]
@@ -0,0 +1,47 @@
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from autogit.actions.argument_parsing import parse_command_line_arguments
+from autogit.actions.get_repository_states import get_repository_states, is_url_or_git, read_repositories_from_file
+
+
+class RepositoryStatesTests(TestCase):
+    def test_is_url_or_git(self):
+        self.assertTrue(is_url_or_git("https://github.com/owner/repo"))
+        self.assertTrue(is_url_or_git("http://gitlab.example.org/owner/repo"))
+        self.assertTrue(is_url_or_git("git@gitlab.com:owner/repo.git"))
+        self.assertTrue(is_url_or_git("ssh://git@gitlab.com/owner/repo.git"))
+        self.assertFalse(is_url_or_git("repos.txt"))
+        self.assertFalse(is_url_or_git("my.company.com-repos.txt"))
+
+    def test_read_repositories_from_file(self):
+        with TemporaryDirectory() as directory:
+            repos_filename = os.path.join(directory, "repos.txt")
+            with open(repos_filename, "w") as f:
+                f.write("https://github.com/owner/foo\n")
+                f.write("\n")
+                f.write("  # https://github.com/owner/bar\n")
+                f.write("  https://gitlab.com/owner/spam  \n")
+
+            self.assertListEqual(
+                read_repositories_from_file(repos_filename),
+                ["https://github.com/owner/foo", "https://gitlab.com/owner/spam"],
+            )
+
+    def test_get_repository_states(self):
+        with TemporaryDirectory() as directory:
+            repos_filename = os.path.join(directory, "repos.txt")
+            with open(repos_filename, "w") as f:
+                f.write("https://github.com/owner/foo.git\nhttps://GitLab.com/owner/bar\n")
+
+            args = parse_command_line_arguments(
+                ["-r", repos_filename, "-r", "https://github.com/owner/spam", "-m", "Update foo"]
+            )
+            repos = get_repository_states(args)
+
+        self.assertListEqual(list(repos), ["foo", "bar", "spam"])
+        self.assertEqual(repos["foo"].url, "https://github.com/owner/foo.git")
+        self.assertEqual(repos["bar"].owner, "owner")
+        self.assertEqual(repos["bar"].domain, "gitlab.com")
+        self.assertEqual(repos["spam"].branch, "update-foo")
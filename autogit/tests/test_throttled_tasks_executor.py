@@ -21,6 +21,36 @@ class ThrottledTasksExecutorTests(TestCase):
 
         self.assertListEqual(generated_greetings, ["Hello, World!", "Hello, Universe!"])
 
+    def test_delay_between_throttled_tasks(self):
+        start_times = []
+
+        async def record_start_time() -> None:
+            start_times.append(asyncio.get_running_loop().time())
+
+        with ThrottledTasksExecutor(delay_between_tasks=0.05) as executor:
+            for _ in range(3):
+                executor.run(record_start_time())
+
+        self.assertEqual(len(start_times), 3)
+        for previous_start_time, start_time in zip(start_times, start_times[1:]):
+            self.assertGreaterEqual(start_time - previous_start_time, 0.05 - 0.005)
+
+    def test_throttle_inside_not_throttled_tasks(self):
+        api_call_times = []
+
+        async def process_repository(preparation_time: float) -> None:
+            await asyncio.sleep(preparation_time)  # All the tasks get to the API call at the same time
+            await executor.throttle()
+            api_call_times.append(asyncio.get_running_loop().time())
+
+        with ThrottledTasksExecutor(delay_between_tasks=0.05) as executor:
+            for preparation_time in (0.03, 0.02, 0.01):
+                executor.run_not_throttled(process_repository(preparation_time))
+
+        self.assertEqual(len(api_call_times), 3)
+        for previous_call_time, call_time in zip(api_call_times, api_call_times[1:]):
+            self.assertGreaterEqual(call_time - previous_call_time, 0.05 - 0.005)
+
     def test_not_throttled_task_execution(self):
         generated_greetings = []
 
@@ -40,10 +70,85 @@ class ThrottledTasksExecutorTests(TestCase):
 
         executor = ThrottledTasksExecutor(delay_between_tasks=0.05)
         executor.start()
-        self.assertEqual(executor.is_running, True)
         executor.run_not_throttled(self.generate_greeting("World"), callback=process_result)
         executor.wait_for_tasks_to_finish()
         executor.stop()
 
-        self.assertEqual(executor.is_running, False)
+        self.assertTrue(executor.loop.is_closed())
         self.assertListEqual(generated_greetings, ["Hello, World!"])
+
+    def test_wait_for_tasks_to_finish_multiple_times(self):
+        generated_greetings = []
+
+        def process_result(greeting: str) -> None:
+            generated_greetings.append(greeting)
+
+        with ThrottledTasksExecutor(delay_between_tasks=0.05) as executor:
+            executor.run(self.generate_greeting("World"), callback=process_result)
+            executor.wait_for_tasks_to_finish()
+            self.assertListEqual(generated_greetings, ["Hello, World!"])
+
+            executor.run(self.generate_greeting("Universe"), callback=process_result)
+            executor.wait_for_tasks_to_finish()
+            self.assertListEqual(generated_greetings, ["Hello, World!", "Hello, Universe!"])
+
+    def test_tasks_submitted_from_callbacks(self):
+        processed_numbers = []
+
+        async def get_number(number: int) -> int:
+            await asyncio.sleep(0.01)
+            return number
+
+        with ThrottledTasksExecutor(delay_between_tasks=0.05) as executor:
+
+            def process_number(number: int) -> None:
+                processed_numbers.append(number)
+                if number < 3:
+                    executor.run_not_throttled(get_number(number + 1), callback=process_number)
+
+            executor.run_not_throttled(get_number(1), callback=process_number)
+
+        self.assertListEqual(processed_numbers, [1, 2, 3])
+
+    def test_exceptions_are_logged(self):
+        generated_greetings = []
+
+        async def fail() -> None:
+            raise ValueError("Greeting generation failed")
+
+        def process_result(greeting: str) -> None:
+            generated_greetings.append(greeting)
+
+        def fail_to_process_result(greeting: str) -> None:
+            raise ValueError("Greeting processing failed")
+
+        with self.assertLogs(level="ERROR") as logs:
+            with ThrottledTasksExecutor(delay_between_tasks=0.05) as executor:
+                executor.run_not_throttled(fail(), callback=process_result)
+                executor.run_not_throttled(self.generate_greeting("World"), callback=fail_to_process_result)
+                executor.run_not_throttled(self.generate_greeting("Universe"), callback=process_result)
+
+        self.assertListEqual(generated_greetings, ["Hello, Universe!"])
+        self.assertEqual(len(logs.records), 2)
+        self.assertIn("Greeting generation failed", logs.output[0])
+        self.assertIn("Greeting processing failed", logs.output[1])
+
+    def test_wait_for_tasks_to_finish_without_tasks(self):
+        with ThrottledTasksExecutor(delay_between_tasks=0.05) as executor:
+            executor.wait_for_tasks_to_finish()
+            self.assertFalse(executor.loop.is_running())
+
+    def test_stop_cancels_unfinished_tasks(self):
+        generated_greetings = []
+
+        def process_result(greeting: str) -> None:
+            generated_greetings.append(greeting)
+
+        executor = ThrottledTasksExecutor(delay_between_tasks=0.05)
+        executor.start()
+        executor.run_not_throttled(self.generate_greeting("World"), callback=process_result)
+        executor.stop()
+
+        self.assertTrue(executor.loop.is_closed())
+        self.assertSetEqual(executor.running_tasks, set())
+        self.assertListEqual(generated_greetings, [])
@@ -1,4 +1,7 @@
+import asyncio
 import os
+from functools import lru_cache
+from typing import Tuple
 from urllib.parse import urlparse
 from random import randint
 from string import ascii_letters, digits
@@ -31,16 +34,19 @@ def to_kebab_case(value: str) -> str:
 
 def get_access_token(url: str) -> str:
     """Retrieves access token from environment vars suitable for provided URL."""
-    parsed_url = urlparse(url)
-    domain = parsed_url.netloc.split("@")[-1].lower()
+    return get_access_token_for_domain(get_domain(url))
+
+
+@lru_cache(maxsize=None)
+def get_access_token_for_domain(domain: str) -> str:
+    """Retrieves access token from environment vars for a lower case domain (environment is read once per domain)."""
     access_token_var_name = ACCESS_TOKEN_VAR_NAMES.get(domain, ACCESS_TOKEN_VAR_NAMES["DEFAULT"])
     return os.getenv(access_token_var_name, "")
 
 
 def get_domain(url: str) -> str:
     """Returs domain name in lower case."""
-    parsed_url = urlparse(url)
-    return parsed_url.netloc.split("@")[-1].lower()
+    return urlparse(url).netloc.rpartition("@")[2].lower()
 
 
 def get_repo_owner(url: str) -> str:
@@ -58,3 +64,17 @@ def get_default_branch(repo: RepoState):
     default_branch_name: str = g.execute(["git", "rev-parse", "--abbrev-ref", "origin/HEAD"])  # type: ignore
     default_branch_name = default_branch_name.split("/", 1)[-1]  # removes `origin/` prefix from the result
     return default_branch_name
+
+
+async def run_git_command(directory: str, *args: str) -> Tuple[int, bytes, bytes]:
+    """Executes git command in a given directory without blocking the event loop."""
+    proc = await asyncio.create_subprocess_exec(
+        "git",
+        "-C",
+        directory,
+        *args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout, stderr = await proc.communicate()
+    return proc.returncode, stdout, stderr  # type: ignore
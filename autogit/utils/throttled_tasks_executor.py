@@ -1,8 +1,8 @@
 import asyncio
-from typing import Any, Callable, Coroutine, Optional, Set, Union
-from threading import Thread
-import traceback
-from sys import version_info
+import logging
+from typing import Any, Callable, Coroutine, Dict, Optional, Set, Union
+
+logger = logging.getLogger()
 
 
 class ThrottledTasksExecutor:
@@ -26,16 +26,11 @@ class ThrottledTasksExecutor:
 
     def __init__(self, delay_between_tasks: float = 0.2, in_separate_process: bool = False):
         self.loop = asyncio.new_event_loop()
-        self.running_tasks: Set[Any] = set()  # TODO: Find the example with task removal from the set.
-        # TODO: Would be nice to have awaitable future, instead of infinite loop.
+        self.running_tasks: Set[asyncio.Task[Any]] = set()  # Strong references to the tasks until they are done
         self.delay_between_tasks = delay_between_tasks
         self.in_separate_process = in_separate_process
-
-        if version_info.major == 3 and version_info.minor >= 10:
-            self.can_task_be_executed = asyncio.Condition()
-        else:
-            self.can_task_be_executed = asyncio.Condition(loop=self.loop)  # type: ignore
-        self.is_running = False
+        self.next_task_start_time = 0.0  # Executor loop time, when the next throttled task is allowed to start
+        self.no_running_tasks: Optional[asyncio.Event] = None  # Created inside the executor loop on the first wait
 
     def __enter__(self) -> "ThrottledTasksExecutor":
         self.start()
@@ -46,7 +41,7 @@ class ThrottledTasksExecutor:
         self.stop()
 
     def start(self, in_separate_process: Optional[bool] = None):
-        """Starts a thread (or a process), which executes coroutines provided to the ThrottledTasksExecutor"""
+        """Prepares the executor for coroutines. They are executed while waiting for tasks to finish."""
 
         if in_separate_process is None:
             in_separate_process = self.in_separate_process
@@ -55,26 +50,20 @@ class ThrottledTasksExecutor:
             # TODO: investigate a way to start coroutines in a separate process:
             #   - https://docs.python.org/3/library/asyncio-eventloop.html#asyncio.loop.run_in_executor
             raise NotImplementedError("Running executor in a separate process is not supported yet")
-        else:
-            thread = Thread(target=self._run_event_loop, daemon=True)
-            thread.start()
-
-        self.is_running = True
-
-        # Periodically emit permission to execute one task
-        self._allow_task_execution_task = asyncio.run_coroutine_threadsafe(
-            self._allow_task_execution(every=self.delay_between_tasks), self.loop
-        )
-
-    def stop(self):
-        """Terminates a thread (or a process), which executes coroutines provided to the ThrottledTasksExecutor"""
-        self._allow_task_execution_task.cancel()
 
-        # Ensures that the _allow_task_execution_task is being fully cancelled https://stackoverflow.com/a/62443715
-        self.loop._run_once()  # type: ignore
+        self.loop.set_exception_handler(self._handle_exception)
 
-        self.loop.stop()
-        self.is_running = False
+    def stop(self) -> None:
+        """Cancels unfinished tasks and closes the event loop the same way as asyncio.run does"""
+        try:
+            if self.running_tasks:
+                for task in self.running_tasks:
+                    task.cancel()
+                self.loop.run_until_complete(asyncio.gather(*self.running_tasks, return_exceptions=True))
+            self.loop.run_until_complete(self.loop.shutdown_asyncgens())
+            self.loop.run_until_complete(self.loop.shutdown_default_executor())
+        finally:
+            self.loop.close()
 
     def run(
         self,
@@ -83,21 +72,14 @@ class ThrottledTasksExecutor:
         callback: Optional[Callable] = None,
         **kwargs,
     ):
-        """Executes coroutine in an executor thread, which makes sure not to hit throttling limits."""
-
-        if callback is None:
-
-            def callback(*args, **kwargs):
-                return None
+        """Executes coroutine in an executor event loop, which makes sure not to hit throttling limits."""
 
         if not isinstance(coroutine, Coroutine):
             coroutine = coroutine(*args, **kwargs)
         if not isinstance(coroutine, Coroutine):
             raise ValueError("Can only execute coroutines, not coroutine provided")
 
-        task = asyncio.run_coroutine_threadsafe(self._throttled_task(coroutine), self.loop)
-        self.running_tasks.add(task)
-        task.add_done_callback(self._mark_task_done(callback))
+        self._submit(self._throttled_task(coroutine), callback)
 
     def run_not_throttled(
         self,
@@ -108,52 +90,49 @@ class ThrottledTasksExecutor:
     ):
         """Executes coroutine in an executor event loop ignoring throttled tasks queue."""
 
-        if callback is None:
-
-            def callback(*args, **kwargs):
-                return None
-
         if not isinstance(coroutine, Coroutine):
             coroutine = coroutine(*args, **kwargs)
         if not isinstance(coroutine, Coroutine):
             raise ValueError("Can only execute coroutines, not coroutine provided")
 
-        task = asyncio.run_coroutine_threadsafe(coroutine, self.loop)
-        self.running_tasks.add(task)
-        task.add_done_callback(self._mark_task_done(callback))
+        self._submit(coroutine, callback)
 
     def wait_for_tasks_to_finish(self):
-        asyncio.run(self.async_wait_for_tasks_to_finish())
+        """Runs the executor event loop until all the provided coroutines are done."""
+        if self.running_tasks:
+            self.loop.run_until_complete(self.async_wait_for_tasks_to_finish())
 
     async def async_wait_for_tasks_to_finish(self):
-        while self.running_tasks:
-            await asyncio.sleep(0.1)
+        if self.running_tasks:
+            if self.no_running_tasks is None:
+                self.no_running_tasks = asyncio.Event()
+            await self.no_running_tasks.wait()
 
-    async def _allow_task_execution(self, every: float, count: int = 1):
-        """Periodically emits event, which allows for `count` tasks to be executed.
+    async def throttle(self) -> None:
+        """Waits for the next time slot, so that throttled actions are at least `delay_between_tasks` apart.
 
-        Params:
-            every: float  - seconds how often a permission is given to `count` tasks to be executed.
-            count: int    - how many tasks are allowed to be run at each event.
+        Can be awaited inside a running coroutine to throttle a single step of it, e.g. an API call.
         """
-        try:
-            while self.is_running:
-                # Does the first task has to wait `every` seconds to be started?
-                async with self.can_task_be_executed:
-                    if count and count > 0:
-                        self.can_task_be_executed.notify(n=count)
-                    else:
-                        self.can_task_be_executed.notify_all()
-                await asyncio.sleep(every)
-        except asyncio.CancelledError:
-            pass
+        # Start time is reserved without awaiting, so concurrent tasks always get different time slots
+        now = self.loop.time()
+        delay = self.next_task_start_time - now
+        self.next_task_start_time = max(now, self.next_task_start_time) + self.delay_between_tasks
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _submit(self, coroutine: Coroutine, callback: Optional[Callable]) -> None:
+        """Schedules coroutine in the executor loop and keeps a reference to it until it is done."""
+        task = self.loop.create_task(coroutine)
+        self.running_tasks.add(task)
+        if self.no_running_tasks is not None:
+            self.no_running_tasks.clear()
+        task.add_done_callback(self._mark_task_done(callback))
 
     def _throttled_task(self, coroutine: Coroutine) -> Coroutine:
-        """Decorator for coroutine to wait for permission before executing the coroutine."""
+        """Decorator for coroutine to wait for its turn before executing the coroutine."""
 
         async def throttled_task_wrapper(*args, **kwargs):
-            async with self.can_task_be_executed:
-                await self.can_task_be_executed.wait()
+            await self.throttle()
             return await coroutine
 
         return throttled_task_wrapper()
@@ -161,23 +140,25 @@ class ThrottledTasksExecutor:
     def _mark_task_done(self, callback):
         """Decorator for callback to set the task as done after the callback is processed."""
 
-        def task_done_wrapper(task: Coroutine) -> None:
+        def task_done_wrapper(task: asyncio.Task[Any]) -> None:
             try:
-                task_result = task.result()  # type: ignore
-            except Exception:
-                print("Got an exception during coroutine execution: {e}")
-                traceback.print_exc()
-            else:
-                try:
-                    callback(task_result)
-                except Exception:
-                    print("Got an exception during callback execution: {e}")
-                    traceback.print_exc()
-            self.running_tasks.discard(task)
+                if task.cancelled():
+                    return None
+                if exception := task.exception():
+                    self.loop.call_exception_handler(
+                        {"message": "Got an exception during coroutine execution", "exception": exception, "task": task}
+                    )
+                elif callback is not None:
+                    callback(task.result())  # Exceptions raised by callback are passed to the loop exception handler
+            finally:
+                # Callback might have submitted new tasks, so the executor is idle only after it is processed
+                self.running_tasks.discard(task)
+                if not self.running_tasks and self.no_running_tasks is not None:
+                    self.no_running_tasks.set()
             return None
 
         return task_done_wrapper
 
-    def _run_event_loop(self):
-        asyncio.set_event_loop(self.loop)
-        self.loop.run_forever()
+    def _handle_exception(self, loop: asyncio.AbstractEventLoop, context: Dict[str, Any]) -> None:
+        """Logs exceptions raised by coroutines and callbacks executed in the executor loop."""
+        logger.error(context["message"], exc_info=context.get("exception"))